@@ -13,8 +13,11 @@ from colorama import init, Fore, Back, Style
 
 from prompt_template import react_system_prompt_template
 
-# Initialize colorama for cross-platform color support
-init(autoreset=True)
+# Compile the ReAct tag patterns once rather than on every model turn
+THOUGHT_PATTERN = re.compile(r"<thought>(.*?)</thought>", re.DOTALL)
+FINAL_ANSWER_PATTERN = re.compile(r"<final_answer>(.*?)</final_answer>", re.DOTALL | re.IGNORECASE)
+ACTION_PATTERN = re.compile(r"<action>(.*?)</action>", re.DOTALL)
+FUNCTION_CALL_PATTERN = re.compile(r'(\w+)\((.*)\)', re.DOTALL)
 
 
 class ReActAgent:
@@ -39,7 +42,7 @@ class ReActAgent:
             content = self.call_model(messages)
 
             # Detect Thought
-            thought_match = re.search(r"<thought>(.*?)</thought>", content, re.DOTALL)
+            thought_match = THOUGHT_PATTERN.search(content)
             if thought_match:
                 thought = thought_match.group(1)
                 print(f"\n\n{Fore.CYAN}💭 Thought:{Style.RESET_ALL} {Fore.WHITE}{thought}{Style.RESET_ALL}")
@@ -47,7 +50,7 @@ class ReActAgent:
             # Check if the model output a Final Answer. If so, return it directly
             if "<final_answer>" in content.lower():
                 # Try to extract final answer with more flexible regex
-                final_answer = re.search(r"<final_answer>(.*?)</final_answer>", content, re.DOTALL | re.IGNORECASE)
+                final_answer = FINAL_ANSWER_PATTERN.search(content)
                 if final_answer:
                     answer = final_answer.group(1).strip()
                     return answer
@@ -83,7 +86,7 @@ class ReActAgent:
                     return "Error: Malformed final answer format"
 
             # Detect Action
-            action_match = re.search(r"<action>(.*?)</action>", content, re.DOTALL)
+            action_match = ACTION_PATTERN.search(content)
             if not action_match:
                 print(f"\n\n{Fore.RED}❌ Model did not output a valid <action> tag.{Style.RESET_ALL}")
                 print(f"{Fore.YELLOW}Model output:{Style.RESET_ALL}")
@@ -161,7 +164,7 @@ class ReActAgent:
                 raise SystemExit(1)
 
     def parse_action(self, code_str: str) -> Tuple[str, List[str]]:
-        match = re.match(r'(\w+)\((.*)\)', code_str, re.DOTALL)
+        match = FUNCTION_CALL_PATTERN.match(code_str)
         if not match:
             raise ValueError("Invalid function call syntax")
 
@@ -275,6 +278,9 @@ def run_terminal_command(command):
 @click.argument('project_directory',
                 type=click.Path(exists=True, file_okay=False, dir_okay=True))
 def main(project_directory):
+    # Initialize colorama for cross-platform color support
+    init(autoreset=True)
+
     project_dir = os.path.abspath(project_directory)
 
     tools = [read_file, write_to_file, run_terminal_command]